@@ -0,0 +1,242 @@
+"""
+ResumeForge - Tailored Content Cache
+Disk-backed LRU cache so repeated job descriptions skip the OpenAI API call.
+
+Besides exact lookups, entries stored with their job description text can be
+found again by fuzzy lookup: a MinHash LSH index over character shingles
+proposes near-duplicate job descriptions and rapidfuzz verifies them.
+
+Separately, one "golden" entry per role category keeps the latest content
+tailored from that role, to be reused for similar job descriptions.
+"""
+
+import os
+import re
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from datasketch import MinHash, MinHashLSH
+from rapidfuzz import fuzz
+
+# Configuration
+CACHE_DIR = Path(".cache")
+GOLDEN_DIR = CACHE_DIR / "golden"
+DEFAULT_CAPACITY = 10_000
+FUZZY_THRESHOLD = 0.95  # Minimum similarity for a fuzzy hit (< 5% edit distance)
+# Shingle Jaccard for an LSH candidate. One edit changes up to SHINGLE_SIZE
+# shingles, so this is far below FUZZY_THRESHOLD; rapidfuzz makes the decision.
+LSH_THRESHOLD = 0.5
+SHINGLE_SIZE = 5
+NUM_PERM = 128
+
+# In-process LRU of serialized entries, mirrored on disk as .cache/<key>.json
+_memory: "OrderedDict[str, str]" = OrderedDict()
+_lock = threading.RLock()
+_disk_count: Optional[int] = None  # Number of entries on disk, counted on first put()
+
+# Fuzzy index over the job description text of the entries on disk
+_lsh: Optional[MinHashLSH] = None
+_fuzzy_texts: Dict[str, Tuple[str, str]] = {}  # key -> (scope, normalized text)
+
+
+def make_key(*parts: str) -> str:
+    """Build a cache key by hashing the given parts."""
+    return hashlib.sha256("|".join(parts).encode('utf-8')).hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return CACHE_DIR / f"{key}.json"
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r'\s+', ' ', text).strip().lower()
+
+
+def _minhash(normalized_text: str) -> MinHash:
+    shingles = {
+        normalized_text[i:i + SHINGLE_SIZE].encode('utf-8')
+        for i in range(max(len(normalized_text) - SHINGLE_SIZE + 1, 1))
+    }
+    minhash = MinHash(num_perm=NUM_PERM)
+    minhash.update_batch(list(shingles))
+    return minhash
+
+
+def _index(key: str, scope: str, normalized_text: str) -> None:
+    if key in _lsh:
+        _lsh.remove(key)
+    _lsh.insert(key, _minhash(normalized_text))
+    _fuzzy_texts[key] = (scope, normalized_text)
+
+
+def _unindex(key: str) -> None:
+    if _lsh is not None and key in _lsh:
+        _lsh.remove(key)
+    _fuzzy_texts.pop(key, None)
+
+
+def _ensure_fuzzy_index() -> None:
+    """Build the fuzzy index from the entries on disk on first use."""
+    global _lsh
+    if _lsh is not None:
+        return
+
+    _lsh = MinHashLSH(threshold=LSH_THRESHOLD, num_perm=NUM_PERM)
+    for path in CACHE_DIR.glob("*.json"):
+        try:
+            entry = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if entry.get("text") is not None:
+            _index(path.stem, entry.get("scope") or "", _normalize(entry["text"]))
+
+
+def get(key: str) -> Optional[Dict]:
+    """
+    Look up a cached value.
+
+    Args:
+        key: Cache key from make_key()
+
+    Returns:
+        A fresh copy of the cached value, or None on a miss
+    """
+    with _lock:
+        path = _entry_path(key)
+        serialized = _memory.get(key)
+        if serialized is not None:
+            _memory.move_to_end(key)
+            value = json.loads(serialized)["value"]
+        else:
+            try:
+                serialized = path.read_text(encoding='utf-8')
+                value = json.loads(serialized)["value"]
+            except (OSError, json.JSONDecodeError, KeyError):
+                return None
+            _memory[key] = serialized
+
+        # Touch the file so disk eviction sees it as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+
+def find_similar(scope: str, text: str,
+                 threshold: float = FUZZY_THRESHOLD) -> Optional[Tuple[str, Dict]]:
+    """
+    Find a cached value whose text is nearly identical to the given text.
+
+    Args:
+        scope: Only entries stored with this scope are considered
+        text: Text to compare against the text stored with each entry
+        threshold: Minimum normalized similarity (0-1) for a hit
+
+    Returns:
+        Tuple of (key, value) for the most similar entry, or None on a miss
+    """
+    normalized_text = _normalize(text)
+
+    with _lock:
+        _ensure_fuzzy_index()
+
+        best_key, best_score = None, threshold * 100
+        for key in _lsh.query(_minhash(normalized_text)):
+            entry_scope, entry_text = _fuzzy_texts[key]
+            if entry_scope != scope:
+                continue
+            score = fuzz.ratio(normalized_text, entry_text, score_cutoff=best_score)
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            return None
+
+        value = get(best_key)
+        if value is None:
+            _unindex(best_key)
+            return None
+        return best_key, value
+
+
+def put(key: str, value: Dict, cap: int = DEFAULT_CAPACITY,
+        text: Optional[str] = None, scope: Optional[str] = None) -> None:
+    """
+    Store a value, evicting the least recently used entries beyond cap.
+
+    Once the disk holds more than cap entries, the least recently used tenth
+    is evicted at once, so the cache directory is only listed occasionally.
+
+    Args:
+        key: Cache key from make_key()
+        value: JSON-serializable value to store
+        cap: Maximum number of entries kept in memory and on disk
+        text: Optional text to make the entry findable by find_similar()
+        scope: Scope the entry is found under by find_similar()
+    """
+    global _disk_count
+    serialized = json.dumps({"value": value, "text": text, "scope": scope})
+
+    with _lock:
+        _memory[key] = serialized
+        _memory.move_to_end(key)
+        while len(_memory) > cap:
+            _memory.popitem(last=False)
+
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        if _disk_count is None:
+            _disk_count = sum(1 for _ in CACHE_DIR.glob("*.json"))
+        path = _entry_path(key)
+        if not path.exists():
+            _disk_count += 1
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(serialized, encoding='utf-8')
+        os.replace(tmp_path, path)
+
+        if text is not None and _lsh is not None:
+            _index(key, scope or "", _normalize(text))
+
+        if _disk_count > cap:
+            entries = list(CACHE_DIR.glob("*.json"))
+            entries.sort(key=lambda p: p.stat().st_mtime_ns)
+            stale_entries = entries[:max(len(entries) - cap + cap // 10, 0)]
+            for stale in stale_entries:
+                stale.unlink(missing_ok=True)
+                _memory.pop(stale.stem, None)
+                _unindex(stale.stem)
+            _disk_count = len(entries) - len(stale_entries)
+
+
+def get_golden(role: str) -> Optional[Dict]:
+    """
+    Look up the golden entry of a role category.
+
+    Args:
+        role: Role folder name
+
+    Returns:
+        The stored entry, or None if the role has none yet
+    """
+    try:
+        return json.loads((GOLDEN_DIR / f"{role}.json").read_text(encoding='utf-8'))
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def put_golden(role: str, value: Dict) -> None:
+    """
+    Replace the golden entry of a role category.
+
+    Args:
+        role: Role folder name
+        value: JSON-serializable entry to store
+    """
+    GOLDEN_DIR.mkdir(parents=True, exist_ok=True)
+    path = GOLDEN_DIR / f"{role}.json"
+    tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+    tmp_path.write_text(json.dumps(value), encoding='utf-8')
+    os.replace(tmp_path, path)
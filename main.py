@@ -5,15 +5,37 @@ Tailors resumes to specific job descriptions using AI-powered content selection.
 """
 
 import os
+import asyncio
 import re
 import json
+import shutil
+import functools
+import hashlib
+import threading
 import subprocess
+import tempfile
 import sys
+import argparse
+from array import array
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Set, Tuple
 from dotenv import load_dotenv
-from openai import OpenAI
-from jinja2 import Template
+import httpx
+from openai import AsyncOpenAI
+import tiktoken
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, Template
+import bm25s
+from rapidfuzz import fuzz, process, utils
+from bm25s.stopwords import STOPWORDS_EN
+
+try:
+    import hyperscan
+except ImportError:  # Prebuilt wheels only exist for x86-64; fall back to the re scanner
+    hyperscan = None
+
+import cache
 
 # Load environment variables
 load_dotenv()
@@ -24,7 +46,107 @@ INPUT_DIR = Path("input")
 TEMPLATES_DIR = Path("templates")
 OUTPUT_DIR = Path("output")
 JOB_DESCRIPTION_FILE = INPUT_DIR / "job_description.txt"
+JOB_DESCRIPTIONS_DIR = INPUT_DIR / "job_descriptions"
 MASTER_TEMPLATE = TEMPLATES_DIR / "master_template.tex"
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")
+CLASSIFIER_MODEL = os.getenv("CLASSIFIER_MODEL", "gpt-4o-mini")
+ROLE_CLASSIFIER = os.getenv("ROLE_CLASSIFIER", "combined")  # "combined" or "logit_bias"
+BATCH_ENDPOINT = "/v1/chat/completions"
+OPENAI_CONCURRENCY = int(os.getenv("OPENAI_CONCURRENCY", "10"))
+PDFLATEX_ENGINE = os.getenv("PDFLATEX_ENGINE", "tectonic")
+FORMAT_DIR = OUTPUT_DIR / ".fmt"
+COMPILE_TMP_DIR = "/dev/shm" if Path("/dev/shm").is_dir() else None  # tmpfs for LaTeX intermediates, if available
+PARSED_CACHE_DIR = cache.CACHE_DIR / "parsed"
+PARSER_VERSION = "2"  # Bump whenever extract_content or the parse cache format change
+EXPERIENCE_TOP_K = int(os.getenv("EXPERIENCE_TOP_K", "40"))
+BM25_BACKEND = "numpy"  # Switched to "numba" by run_pipeline for runs with at least NUMBA_MIN_QUERIES rankings
+NUMBA_MIN_QUERIES = 5_000  # Numba saves ~0.5 ms per ranking but costs ~3 s of JIT compile per process
+GOLDEN_SIMILARITY = float(os.getenv("GOLDEN_SIMILARITY", "0.7"))  # JD keyword overlap to reuse a role's golden content
+FORMAT_LOCK = threading.Lock()  # Concurrent renders must not build the same format twice
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", str(os.cpu_count() or 1)))
+PDF_EXECUTOR = ThreadPoolExecutor(max_workers=PDF_WORKERS, thread_name_prefix="render_pdf")
+
+# LaTeX extraction patterns (Module B), compiled once. A single alternation
+# lets extract_content walk each file exactly once: \item bullets run until
+# the next \item or list end, text blocks are paragraphs starting with a
+# capital letter, and comments between them are consumed without output.
+# The patterns are disjoint character classes, so matching is linear-time.
+TEX_BLOCK_PATTERN = r'(?:^|\n)(?P<block>[A-Z][^\\%\n]+(?:\n[^\\%\n]+)*)'
+TEX_SCANNER_RE = re.compile(
+    r'(?P<comment>%[^\n]*)'
+    r'|\\item\s+(?P<item>.+?)(?=\\item|\\end\{(?:itemize|enumerate)\}|\Z)'
+    r'|' + TEX_BLOCK_PATTERN,
+    re.DOTALL
+)
+
+# The same scan as a single Hyperscan database over its literal boundaries.
+# Hyperscan reports only where a match ends, so every pattern has a fixed length.
+TEX_BOUNDARIES = (b"\\item", b"\\end{itemize}", b"\\end{enumerate}", b"%")
+ITEM_BOUNDARY, COMMENT_BOUNDARY = 0, len(TEX_BOUNDARIES) - 1
+ITEM_SPACE_RE = re.compile(rb'\s+')
+# Text blocks never contain a backslash or %, so they only occur between items and comments
+TEX_BLOCK_RE = re.compile(TEX_BLOCK_PATTERN.encode('ascii'))
+
+# LaTeX markup in extracted items, turned into plain text by latex_to_text.
+# Commands whose argument is not text (URLs, spacing, references) are dropped
+# with it; other commands are dropped and their arguments kept.
+LATEX_COMMENT_RE = re.compile(r'(?<!\\)%[^\n]*')
+LATEX_DROPPED_ARG_RE = re.compile(
+    r'\\(?:href|[hv]space|label|ref|cite\w*|includegraphics|footnote)\*?\s*(?:\[[^\]]*\])?\{[^{}]*\}'
+)
+LATEX_TOKEN_RE = re.compile(
+    r'\\(?P<special>[&%$#_{}~^ ,;])'
+    r'|\\\\(?:\[[^\]]*\])?'
+    r'|\\(?P<command>[A-Za-z]+)\*?\s*(?:\[[^\]]*\])?'
+    r'|[{}$~]'
+)
+LATEX_TEXT_COMMANDS = {
+    "sim": "~", "approx": "~", "times": "x", "pm": "+/-",
+    "geq": ">=", "ge": ">=", "leq": "<=", "le": "<=", "rightarrow": "->", "to": "->",
+    "ldots": "...", "dots": "...", "textendash": "--", "textemdash": "---",
+    "textasciitilde": "~", "textasciicircum": "^", "textbackslash": "\\", "textbar": "|",
+    "textless": "<", "textgreater": ">", "TeX": "TeX", "LaTeX": "LaTeX",
+}
+
+
+def build_tex_database() -> Optional["hyperscan.Database"]:
+    """Compile TEX_BOUNDARIES into a Hyperscan database, if Hyperscan is installed."""
+    if hyperscan is None:
+        return None
+    
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[re.escape(boundary) for boundary in TEX_BOUNDARIES],
+        ids=list(range(len(TEX_BOUNDARIES))),
+        elements=len(TEX_BOUNDARIES)
+    )
+    return database
+
+
+TEX_DATABASE = build_tex_database()
+
+# Words compared between job descriptions to find a role's golden content
+KEYWORD_RE = re.compile(r'[a-z0-9][a-z0-9+#]*')
+KEYWORD_STOPWORDS = frozenset(STOPWORDS_EN)
+
+# Commands whose output depends on the .aux file of a previous LaTeX run
+CROSS_REFERENCE_RE = re.compile(r'\\(?:(?:page|auto|eq)?ref|cite\w*|tableofcontents)\b')
+
+# Characters that are special in LaTeX, mapped to their escaped form in a single translate() pass
+LATEX_ESCAPE = str.maketrans({
+    "\\": r"\textbackslash{}",
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+})
+# Stray escapes the LLM may still write despite being asked for plain text
+LATEX_ESCAPED_RE = re.compile(r'\\([&%$#_{}])')
 
 
 class ResumeForgeError(Exception):
@@ -32,8 +154,8 @@ class ResumeForgeError(Exception):
     pass
 
 
-def setup_openai_client() -> OpenAI:
-    """Initialize OpenAI client with API key from environment."""
+def setup_openai_client() -> AsyncOpenAI:
+    """Initialize async OpenAI client with API key from environment."""
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise ResumeForgeError(
@@ -41,21 +163,107 @@ def setup_openai_client() -> OpenAI:
             "Please create a .env file with your API key. "
             "See .env.example for reference."
         )
-    return OpenAI(api_key=api_key)
+    # All requests share one HTTP/2 connection pool, so concurrent requests
+    # are multiplexed over warm connections instead of each paying for a
+    # new TLS handshake.
+    http_client = httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(60.0, connect=5.0),
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    )
+    # The SDK retries rate-limit (429), timeout and 5xx errors with
+    # exponential backoff; two retries gives up to 3 attempts per request.
+    return AsyncOpenAI(api_key=api_key, http_client=http_client, max_retries=2)
+
+
+def load_cached_content(jd_text: str, experience: str) -> Optional[Dict]:
+    """
+    Look up content previously tailored from the same experience with the same model.
+    
+    Tries an exact match on the job description first, then a fuzzy match
+    against near-identical job descriptions.
+    
+    Args:
+        jd_text: The job description text
+        experience: The experience the content is tailored from
+        
+    Returns:
+        The cached tailored content, or None on a miss
+    """
+    scope = cache.make_key(OPENAI_MODEL, experience)
+    
+    cached_content = cache.get(cache.make_key(scope, jd_text))
+    if cached_content is not None:
+        print("✓ Cache hit: reusing previously tailored content (no API call)")
+        return cached_content
+    
+    match = cache.find_similar(scope, jd_text)
+    if match is not None:
+        key, cached_content = match
+        print(f"✓ Cache fuzzy hit: reusing content tailored for a near-identical "
+              f"job description (entry {key[:12]}, no API call)")
+        return cached_content
+    
+    return None
+
+
+def save_cached_content(jd_text: str, experience: str, tailored_content: Dict) -> None:
+    """Store tailored content so load_cached_content() can find it again."""
+    scope = cache.make_key(OPENAI_MODEL, experience)
+    cache.put(cache.make_key(scope, jd_text), tailored_content, text=jd_text, scope=scope)
 
 
 # ============================================================================
 # MODULE A: The Classifier
 # ============================================================================
 
-def select_role_folder(jd_text: str, list_of_folders: List[str], client: OpenAI) -> str:
+def match_role_folder(selected_folder: str, list_of_folders: List[str]) -> str:
+    """
+    Map a folder name returned by the LLM onto one of the known role folders.
+    
+    Args:
+        selected_folder: The folder name as returned by the LLM
+        list_of_folders: List of available role folder names
+        
+    Returns:
+        The matching folder name from list_of_folders
+    """
+    if selected_folder in list_of_folders:
+        return selected_folder
+    
+    # Try to find a close match, ignoring case and punctuation such as "_"
+    match = process.extractOne(selected_folder, list_of_folders, scorer=fuzz.WRatio,
+                               processor=utils.default_process, score_cutoff=60)
+    if match is not None:
+        return match[0]
+    
+    raise ResumeForgeError(
+        f"LLM returned invalid folder: '{selected_folder}'. "
+        f"Expected one of: {list_of_folders}"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def classifier_encoding(model: str) -> tiktoken.Encoding:
+    """Tokenizer of the classifier model, used to build its logit_bias."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+async def select_role_folder(jd_text: str, list_of_folders: List[str], client: AsyncOpenAI) -> str:
     """
     Classify which role folder best matches the job description.
     
+    The folders are numbered and the cheap CLASSIFIER_MODEL answers with a
+    single token: logit_bias restricts its output to the folder numbers, so
+    the classification costs one output token.
+    
     Args:
         jd_text: The job description text
         list_of_folders: List of available role folder names
-        client: OpenAI client instance
+        client: AsyncOpenAI client instance
         
     Returns:
         The name of the best matching folder
@@ -65,42 +273,39 @@ def select_role_folder(jd_text: str, list_of_folders: List[str], client: OpenAI)
     system_prompt = """You are an expert career advisor and resume specialist. 
 Your task is to analyze a job description and determine which role category it best fits into."""
     
+    numbered_folders = "\n".join(f"{i}. {folder}" for i, folder in enumerate(list_of_folders, 1))
+    
     user_prompt = f"""Given the following job description, select the SINGLE role category that best matches.
 
 Job Description:
 {jd_text}
 
 Available Role Categories:
-{', '.join(list_of_folders)}
+{numbered_folders}
 
-Return ONLY the exact folder name from the list above that best matches this job description.
-Do not include any explanation, just the folder name."""
+Return ONLY the number of the role category above that best matches this job description."""
 
     try:
-        response = client.chat.completions.create(
-            model=os.getenv("OPENAI_MODEL", "gpt-4"),
+        encoding = classifier_encoding(CLASSIFIER_MODEL)
+        folders_by_label = {str(i): folder for i, folder in enumerate(list_of_folders, 1)}
+        
+        label_tokens = [encoding.encode(label) for label in folders_by_label]
+        if any(len(tokens) != 1 for tokens in label_tokens):
+            raise ResumeForgeError(f"Too many role folders for single-token classification: {len(list_of_folders)}")
+        
+        response = await client.chat.completions.create(
+            model=CLASSIFIER_MODEL,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ],
-            temperature=0.3,
-            max_tokens=50
+            logit_bias={str(tokens[0]): 100 for tokens in label_tokens},
+            temperature=0,
+            max_tokens=1
         )
         
-        selected_folder = response.choices[0].message.content.strip()
-        
-        # Validate the response
-        if selected_folder not in list_of_folders:
-            # Try to find a close match
-            for folder in list_of_folders:
-                if folder.lower() in selected_folder.lower() or selected_folder.lower() in folder.lower():
-                    selected_folder = folder
-                    break
-            else:
-                raise ResumeForgeError(
-                    f"LLM returned invalid folder: '{selected_folder}'. "
-                    f"Expected one of: {list_of_folders}"
-                )
+        answer = response.choices[0].message.content.strip()
+        selected_folder = folders_by_label.get(answer) or match_role_folder(answer, list_of_folders)
         
         print(f"✓ Selected role category: {selected_folder}")
         return selected_folder
@@ -113,7 +318,48 @@ Do not include any explanation, just the folder name."""
 # MODULE B: The Content Parser
 # ============================================================================
 
-def parse_tex_files(folder_path: Path) -> str:
+@dataclass(eq=False)
+class ContentStore:
+    """
+    Extracted experience items stored as one UTF-8 buffer plus end offsets.
+    
+    Item i is buf[offsets[i]:offsets[i + 1]]. Keeping all items in a single
+    buffer avoids one Python string object per item; items are decoded only
+    when accessed.
+    """
+    buf: bytearray = field(default_factory=bytearray)
+    offsets: array = field(default_factory=lambda: array('i', [0]))
+    
+    def add(self, item: str) -> None:
+        """Append an item."""
+        self.buf += item.encode('utf-8')
+        self.offsets.append(len(self.buf))
+    
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+    
+    def __getitem__(self, i: int) -> str:
+        return str(memoryview(self.buf)[self.offsets[i]:self.offsets[i + 1]], 'utf-8')
+    
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+    
+    def to_json(self) -> Dict:
+        """JSON-serializable form, see from_json()."""
+        return {"text": self.buf.decode('utf-8'), "offsets": self.offsets.tolist()}
+    
+    @classmethod
+    def from_json(cls, data: Dict) -> "ContentStore":
+        """Rebuild a store from to_json() output, raising ValueError if it is malformed."""
+        if not isinstance(data, dict) or not isinstance(data.get("text"), str):
+            raise ValueError("Not a ContentStore")
+        store = cls(bytearray(data["text"].encode('utf-8')), array('i', data["offsets"]))
+        if store.offsets[:1] != array('i', [0]) or store.offsets[-1] != len(store.buf):
+            raise ValueError("ContentStore offsets do not match its text")
+        return store
+
+
+def parse_tex_files(folder_path: Path) -> ContentStore:
     """
     Parse LaTeX files and extract content (bullet points and text blocks).
     
@@ -121,14 +367,14 @@ def parse_tex_files(folder_path: Path) -> str:
         folder_path: Path to the folder containing .tex files
         
     Returns:
-        Concatenated string of all extracted experience content
+        Store of all extracted experience content items
     """
     print(f"\n[MODULE B] Parsing LaTeX files from {folder_path}...")
     
     if not folder_path.exists():
         raise ResumeForgeError(f"Folder not found: {folder_path}")
     
-    tex_files = list(folder_path.glob("*.tex"))
+    tex_files = sorted(folder_path.glob("*.tex"))
     
     if not tex_files:
         print(f"⚠ Warning: No .tex files found in {folder_path}")
@@ -141,35 +387,187 @@ def parse_tex_files(folder_path: Path) -> str:
         tex_files = [sample_file]
         print(f"✓ Created sample file: {sample_file}")
     
-    all_content = []
+    # Reuse the previous parse if no file was added, removed or modified
+    # and the parser itself is unchanged
+    role = folder_path.name
+    signature = []
+    for tex_file in tex_files:
+        stat = tex_file.stat()
+        signature.append((tex_file.name, stat.st_mtime_ns, stat.st_size))
+    parsed_cache_file = PARSED_CACHE_DIR / f"{role}_{cache.make_key(PARSER_VERSION, json.dumps(signature))}.json"
+    
+    if parsed_cache_file.exists():
+        try:
+            all_content = ContentStore.from_json(json.loads(parsed_cache_file.read_text(encoding='utf-8')))
+            print(f"✓ Reused cached parse: {len(all_content)} content items from {len(tex_files)} file(s)")
+            return all_content
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    
+    all_content = ContentStore()
     
     for tex_file in tex_files:
         print(f"  Processing: {tex_file.name}")
         content = tex_file.read_text(encoding='utf-8', errors='ignore')
         
-        # Extract \item bullet points
-        items = re.findall(r'\\item\s+(.+?)(?=\\item|\\end\{itemize\}|\\end\{enumerate\}|$)', 
-                          content, re.DOTALL)
+        # Extract \item bullet points and text blocks (paragraphs not in lists),
+        # skipping comments
+        items, text_blocks = extract_content(content)
+        text_blocks = [block for block in text_blocks if len(block) > 50]
+        
+        for item in items + text_blocks:
+            all_content.add(item)
+    
+    print(f"✓ Extracted {len(all_content)} content items from {len(tex_files)} file(s)")
+    
+    # Replace this role's stale parse, if any, with the fresh one
+    PARSED_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for stale in PARSED_CACHE_DIR.glob(f"{role}_*.json"):
+        if stale.stem.rsplit("_", 1)[0] == role:
+            stale.unlink(missing_ok=True)
+    parsed_cache_file.write_text(json.dumps(all_content.to_json()), encoding='utf-8')
+    
+    return all_content
+
+
+def latex_to_text(latex: str) -> str:
+    """
+    Turn LaTeX markup from the library into plain text.
+    
+    Comments are removed, formatting commands such as \\textbf{...} and math
+    delimiters are unwrapped, escaped specials such as \\% are unescaped and common math
+    symbols become ASCII, so the LLM only ever sees (and copies) plain text.
+    
+    Args:
+        latex: An extracted item or text block
+        
+    Returns:
+        The plain text, with whitespace collapsed
+    """
+    def replace(match: re.Match) -> str:
+        if match.group("special") is not None:
+            return " " if match.group("special") in " ,;" else match.group("special")
+        if match.group("command") is not None:
+            return LATEX_TEXT_COMMANDS.get(match.group("command"), "")
+        return " " if match.group(0)[0] in "\\~" else ""
+    
+    text = LATEX_DROPPED_ARG_RE.sub('', LATEX_COMMENT_RE.sub('', latex))
+    return ' '.join(LATEX_TOKEN_RE.sub(replace, text).split())
+
+
+def extract_content(content: str) -> Tuple[List[str], List[str]]:
+    """
+    Extract \\item bullet points and text blocks from LaTeX content, skipping comments.
+    
+    With Hyperscan installed, the file is scanned once for every item, list
+    end and comment boundary. Items are sliced out between those boundaries
+    and text blocks are matched only in the gaps outside items and comments.
+    Otherwise TEX_SCANNER_RE does the same scan in one pass.
+    
+    Args:
+        content: LaTeX file content
         
-        # Clean up the items
-        items = [item.strip().replace('\n', ' ').replace('  ', ' ') for item in items]
+    Returns:
+        Tuple of (bullet points, text blocks) as plain text
+    """
+    if TEX_DATABASE is None:
+        items = []
+        blocks = []
+        for match in TEX_SCANNER_RE.finditer(content):
+            if match.lastgroup == "item":
+                items.append(latex_to_text(match.group("item")))
+            elif match.lastgroup == "block":
+                blocks.append(latex_to_text(match.group("block")))
+        return items, blocks
+    
+    data = content.encode('utf-8')
+    boundaries = []
+    TEX_DATABASE.scan(
+        data,
+        match_event_handler=lambda boundary, _, end, flags, context: boundaries.append(
+            (end - len(TEX_BOUNDARIES[boundary]), end, boundary)
+        )
+    )
+    boundaries.sort()
+    
+    items = []
+    gaps = []
+    item_start = None
+    gap_start = 0
+    skip_until = 0
+    for start, end, boundary in boundaries:
+        if start < skip_until:
+            continue
         
-        # Extract text blocks (paragraphs not in lists)
-        # Remove comments
-        content_no_comments = re.sub(r'%.*', '', content)
+        # Comments only count between items; inside one they are part of its text
+        if boundary == COMMENT_BOUNDARY:
+            if item_start is None:
+                gaps.append((gap_start, start))
+                newline = data.find(b"\n", end)
+                skip_until = gap_start = len(data) if newline < 0 else newline
+            continue
         
-        # Find text blocks between sections
-        text_blocks = re.findall(r'(?:^|\n)([A-Z][^\\%\n]+(?:\n[^\\%\n]+)*)', content_no_comments)
-        text_blocks = [block.strip() for block in text_blocks if len(block.strip()) > 50]
+        # Any \\item or list end closes the current item
+        if item_start is not None:
+            items.append(data[item_start:start])
+            item_start = None
+            gap_start = start
         
-        all_content.extend(items)
-        all_content.extend(text_blocks)
+        space = ITEM_SPACE_RE.match(data, end) if boundary == ITEM_BOUNDARY else None
+        if space:
+            # Like TEX_SCANNER_RE, an item's text is at least one character long
+            gaps.append((gap_start, start))
+            item_start = end
+            skip_until = space.end() + 1
     
-    combined_content = "\n\n".join(all_content)
+    if item_start is not None:
+        if skip_until <= len(data) or len(data) - item_start > 1:
+            items.append(data[item_start:])
+    else:
+        gaps.append((gap_start, len(data)))
     
-    print(f"✓ Extracted {len(all_content)} content items from {len(tex_files)} file(s)")
+    blocks = [
+        latex_to_text(match.group("block").decode('utf-8'))
+        for gap_start, gap_end in gaps
+        for match in TEX_BLOCK_RE.finditer(data, gap_start, gap_end)
+    ]
+    return [latex_to_text(item.decode('utf-8')) for item in items], blocks
+
+
+@functools.lru_cache(maxsize=None)
+def build_bullet_index(bullets: ContentStore, backend: str = "numpy") -> bm25s.BM25:
+    """Build a BM25 index over experience items (once per store and backend)."""
+    retriever = bm25s.BM25()
+    retriever.index(bm25s.tokenize(list(bullets), stopwords="en", show_progress=False),
+                    show_progress=False)
+    if backend == "numba":
+        # Score queries with bm25s' numba-JIT-compiled kernels instead of NumPy
+        retriever.activate_numba_scorer()
+    return retriever
+
+
+def select_relevant_bullets(jd_text: str, bullets: ContentStore, k: int = EXPERIENCE_TOP_K) -> List[str]:
+    """
+    Rank experience items against the job description with BM25 and keep the top k.
+    
+    Ranking locally takes microseconds and keeps the prompt (and so the API
+    cost and time to first token) bounded no matter how large the library grows.
     
-    return combined_content
+    Args:
+        jd_text: The job description text
+        bullets: Extracted experience content items
+        k: Number of items to keep
+        
+    Returns:
+        The k most relevant items, most relevant first
+    """
+    if len(bullets) <= k:
+        return list(bullets)
+    
+    retriever = build_bullet_index(bullets, BM25_BACKEND)
+    ids, _ = retriever.retrieve(bm25s.tokenize(jd_text, stopwords="en", show_progress=False),
+                                k=k, show_progress=False, backend_selection=BM25_BACKEND)
+    return [bullets[i] for i in ids[0]]
 
 
 def create_sample_tex_content(role_category: str) -> str:
@@ -208,20 +606,24 @@ def create_sample_tex_content(role_category: str) -> str:
 # MODULE C: The Synthesizer (OpenAI API)
 # ============================================================================
 
-def generate_tailored_content(jd_text: str, available_experience: str, client: OpenAI) -> Dict:
+async def generate_tailored_content(jd_text: str, available_experience: str, client: AsyncOpenAI) -> Dict:
     """
     Use OpenAI API to generate tailored resume content.
     
     Args:
         jd_text: The job description text
         available_experience: Extracted experience from LaTeX files
-        client: OpenAI client instance
+        client: AsyncOpenAI client instance
         
     Returns:
         Dictionary with 'summary', 'experience_items', and 'skills'
     """
     print("\n[MODULE C] Generating tailored content with OpenAI...")
     
+    cached_content = load_cached_content(jd_text, available_experience)
+    if cached_content is not None:
+        return cached_content
+    
     system_prompt = """You are an expert resume writer with deep knowledge of ATS optimization and hiring practices.
 Your task is to tailor resume content to match specific job descriptions while maintaining authenticity."""
 
@@ -238,6 +640,8 @@ Please provide:
 2. Select the top 5-7 bullet points from the available experience that best match the job requirements
 3. A list of Technical Skills found in the experience that match the job description
 
+Write plain text only: no LaTeX commands or escapes.
+
 Return your response as a JSON object with this exact structure:
 {{
     "summary": "Your 3-sentence profile summary here...",
@@ -252,8 +656,8 @@ Return your response as a JSON object with this exact structure:
 Important: Return ONLY the JSON object, no additional text or formatting."""
 
     try:
-        response = client.chat.completions.create(
-            model=os.getenv("OPENAI_MODEL", "gpt-4"),
+        response = await client.chat.completions.create(
+            model=OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
@@ -274,9 +678,9 @@ Important: Return ONLY the JSON object, no additional text or formatting."""
         tailored_content = json.loads(content)
         
         # Validate structure
-        required_keys = {"summary", "experience_items", "skills"}
-        if not required_keys.issubset(tailored_content.keys()):
-            raise ResumeForgeError(f"Missing required keys in response. Expected: {required_keys}")
+        validate_tailored_content(tailored_content, {"summary", "experience_items", "skills"})
+        
+        save_cached_content(jd_text, available_experience, tailored_content)
         
         print(f"✓ Generated tailored content:")
         print(f"  - Summary: {len(tailored_content['summary'])} characters")
@@ -291,10 +695,465 @@ Important: Return ONLY the JSON object, no additional text or formatting."""
         raise ResumeForgeError(f"Error generating tailored content: {str(e)}")
 
 
+def validate_tailored_content(tailored_content: Dict, required_keys: Set[str]) -> None:
+    """
+    Check that tailored content has the fields and types the renderer expects.
+    
+    Content is only cached after this check, so a malformed response cannot
+    break later runs.
+    
+    Args:
+        tailored_content: Parsed JSON returned by the LLM
+        required_keys: Keys the content must contain
+    """
+    if not isinstance(tailored_content, dict) or not required_keys.issubset(tailored_content.keys()):
+        raise ResumeForgeError(f"Missing required keys in response. Expected: {required_keys}")
+    
+    experience_items = tailored_content["experience_items"]
+    if not isinstance(tailored_content["summary"], str) or not isinstance(tailored_content["skills"], str):
+        raise ResumeForgeError("Invalid response: 'summary' and 'skills' must be strings")
+    if not isinstance(experience_items, list) or not all(isinstance(item, str) for item in experience_items):
+        raise ResumeForgeError("Invalid response: 'experience_items' must be a list of strings")
+
+
+# ============================================================================
+# MODULE A+C: Combined Classifier & Synthesizer
+# ============================================================================
+
+def build_tailoring_request(jd_text: str, roles_to_bullets: Dict[str, ContentStore]) -> Dict:
+    """
+    Build the chat completion request for the combined classify + generate step.
+    
+    Args:
+        jd_text: The job description text
+        roles_to_bullets: Mapping of role folder name to its extracted experience items
+        
+    Returns:
+        Keyword arguments for client.chat.completions.create (also used as
+        the request body of a Batch API line)
+    """
+    system_prompt = """You are an expert career advisor and resume writer with deep knowledge of ATS optimization and hiring practices.
+Your task is to pick the role category that best fits a job description and tailor resume content from that category while maintaining authenticity."""
+
+    # Only the items most relevant to this job description are sent
+    role_sections = "\n\n".join(
+        f"=== ROLE CATEGORY: {role} ===\n" + "\n\n".join(select_relevant_bullets(jd_text, bullets))
+        for role, bullets in roles_to_bullets.items()
+    )
+
+    user_prompt = f"""Below is a job description followed by the available experience, grouped by role category.
+
+JOB DESCRIPTION:
+{jd_text}
+
+AVAILABLE EXPERIENCE BY ROLE CATEGORY:
+{role_sections}
+
+Please:
+1. Select the SINGLE role category that best matches the job description
+2. Using ONLY the experience from that role category, write a compelling 3-sentence Profile Summary that highlights the most relevant qualifications for this role
+3. Select the top 5-7 bullet points from that role category that best match the job requirements
+4. List the Technical Skills found in that experience that match the job description
+
+Write plain text only: no LaTeX commands or escapes.
+
+Return your response as a JSON object with this exact structure:
+{{
+    "role": "Exact role category name from the list above",
+    "summary": "Your 3-sentence profile summary here...",
+    "experience_items": [
+        "First relevant bullet point...",
+        "Second relevant bullet point...",
+        "etc..."
+    ],
+    "skills": "Python, TensorFlow, PyTorch, Computer Vision, Deep Learning, etc."
+}}"""
+
+    return {
+        "model": OPENAI_MODEL,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ],
+        "response_format": {"type": "json_object"},
+        "temperature": 0.7,
+        "max_tokens": 1800,
+    }
+
+
+def serialize_roles(roles_to_bullets: Dict[str, ContentStore]) -> str:
+    """Serialize all roles' experience for cache lookups of the combined step."""
+    return json.dumps({role: bullets.to_json() for role, bullets in roles_to_bullets.items()}, sort_keys=True)
+
+
+def parse_tailoring_response(content: str, list_of_folders: List[str]) -> Dict:
+    """
+    Parse and validate the JSON returned by the combined classify + generate step.
+    
+    Args:
+        content: Raw message content returned by the LLM
+        list_of_folders: List of available role folder names
+        
+    Returns:
+        Dictionary with 'role', 'summary', 'experience_items', and 'skills'
+    """
+    try:
+        tailored_content = json.loads(content.strip())
+    except json.JSONDecodeError as e:
+        raise ResumeForgeError(f"Failed to parse JSON response: {str(e)}\nResponse: {content}")
+    
+    # Validate structure
+    validate_tailored_content(tailored_content, {"role", "summary", "experience_items", "skills"})
+    
+    tailored_content["role"] = match_role_folder(str(tailored_content["role"]).strip(), list_of_folders)
+    
+    return tailored_content
+
+
+def jd_keywords(jd_text: str) -> Set[str]:
+    """Lowercased words of a job description, without stopwords."""
+    return set(KEYWORD_RE.findall(jd_text.lower())) - KEYWORD_STOPWORDS
+
+
+@functools.lru_cache(maxsize=None)
+def role_signature(role: str, bullets: ContentStore) -> str:
+    """Identify the model and experience golden content of a role was tailored from."""
+    return cache.make_key(OPENAI_MODEL, serialize_roles({role: bullets}))
+
+
+def save_golden_content(jd_text: str, tailored_content: Dict, roles_to_bullets: Dict[str, ContentStore]) -> None:
+    """Keep freshly generated content as the golden content of its role."""
+    validate_tailored_content(tailored_content, {"role", "summary", "experience_items", "skills"})
+    
+    role = tailored_content["role"]
+    cache.put_golden(role, {
+        "signature": role_signature(role, roles_to_bullets[role]),
+        "keywords": sorted(jd_keywords(jd_text)),
+        "summary_tmpl": tailored_content["summary"],
+        "skills": tailored_content["skills"],
+        "common_bullets": tailored_content["experience_items"]
+    })
+
+
+def find_golden_content(jd_text: str, roles_to_bullets: Dict[str, ContentStore]) -> Optional[Tuple[str, Dict, float]]:
+    """
+    Find the role whose golden content was tailored for a similar job description.
+    
+    Similarity is the Jaccard index of the job description keywords. Golden
+    content tailored from other experience or another model is ignored.
+    
+    Args:
+        jd_text: The job description text
+        roles_to_bullets: Mapping of role folder name to its extracted experience items
+        
+    Returns:
+        Tuple of (role, golden content, similarity), or None if no role is
+        more similar than GOLDEN_SIMILARITY
+    """
+    keywords = jd_keywords(jd_text)
+    
+    best_match, best_similarity = None, GOLDEN_SIMILARITY
+    for role, bullets in roles_to_bullets.items():
+        golden = cache.get_golden(role)
+        if golden is None or golden.get("signature") != role_signature(role, bullets):
+            continue
+        
+        golden_keywords = set(golden["keywords"])
+        union = keywords | golden_keywords
+        similarity = len(keywords & golden_keywords) / len(union) if union else 0.0
+        if similarity > best_similarity:
+            best_match, best_similarity = (role, golden), similarity
+    
+    return None if best_match is None else (*best_match, best_similarity)
+
+
+async def tailor_from_golden(jd_text: str, roles_to_bullets: Dict[str, ContentStore],
+                             client: AsyncOpenAI) -> Optional[Dict]:
+    """
+    Reuse the golden content of a role, rewriting only its summary for this job description.
+    
+    The request carries the job description and one summary instead of the
+    experience of every role, and skips role classification.
+    
+    Args:
+        jd_text: The job description text
+        roles_to_bullets: Mapping of role folder name to its extracted experience items
+        client: AsyncOpenAI client instance
+        
+    Returns:
+        Dictionary with 'role', 'summary', 'experience_items', and 'skills',
+        or None if no role has golden content for a similar job description
+    """
+    match = find_golden_content(jd_text, roles_to_bullets)
+    if match is None:
+        return None
+    
+    role, golden, similarity = match
+    print(f"✓ Golden content hit for role '{role}' (keyword overlap {similarity:.2f}): rewriting the summary only")
+    
+    user_prompt = f"""Rewrite this resume Profile Summary for the job description below. Keep it to 3 sentences and keep every claim supported by the original summary.
+Write plain text only: no LaTeX commands or escapes.
+
+PROFILE SUMMARY:
+{golden['summary_tmpl']}
+
+JOB DESCRIPTION:
+{jd_text}
+
+Return your response as a JSON object: {{"summary": "Your rewritten summary here..."}}"""
+
+    try:
+        response = await client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=[{"role": "user", "content": user_prompt}],
+            response_format={"type": "json_object"},
+            temperature=0.7,
+            max_tokens=300
+        )
+        summary = json.loads(response.choices[0].message.content)["summary"]
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        raise ResumeForgeError(f"Failed to parse rewritten summary: {str(e)}")
+    except Exception as e:
+        raise ResumeForgeError(f"Error rewriting golden summary: {str(e)}")
+    
+    golden_content = {
+        "role": role,
+        "summary": summary,
+        "experience_items": golden["common_bullets"],
+        "skills": golden["skills"]
+    }
+    validate_tailored_content(golden_content, {"role", "summary", "experience_items", "skills"})
+    
+    print(f"✓ Selected role category: {role}")
+    
+    # Callers may modify the items; the cached golden content must stay intact
+    golden_content["experience_items"] = list(golden_content["experience_items"])
+    return golden_content
+
+
+async def classify_and_generate(jd_text: str, roles_to_bullets: Dict[str, ContentStore], client: AsyncOpenAI) -> Dict:
+    """
+    Select the best role folder and generate tailored content in a single API call.
+    
+    Args:
+        jd_text: The job description text
+        roles_to_bullets: Mapping of role folder name to its extracted experience items
+        client: AsyncOpenAI client instance
+        
+    Returns:
+        Dictionary with 'role', 'summary', 'experience_items', and 'skills'
+    """
+    print("\n[MODULE A+C] Classifying role and generating tailored content with OpenAI...")
+    
+    cached_content = load_cached_content(jd_text, serialize_roles(roles_to_bullets))
+    if cached_content is not None:
+        print(f"✓ Selected role category: {cached_content['role']}")
+        return cached_content
+    
+    golden_content = await tailor_from_golden(jd_text, roles_to_bullets, client)
+    if golden_content is not None:
+        save_cached_content(jd_text, serialize_roles(roles_to_bullets), golden_content)
+        return golden_content
+    
+    try:
+        response = await client.chat.completions.create(
+            **build_tailoring_request(jd_text, roles_to_bullets)
+        )
+        
+        tailored_content = parse_tailoring_response(
+            response.choices[0].message.content, list(roles_to_bullets)
+        )
+        save_cached_content(jd_text, serialize_roles(roles_to_bullets), tailored_content)
+        save_golden_content(jd_text, tailored_content, roles_to_bullets)
+        
+        print(f"✓ Selected role category: {tailored_content['role']}")
+        print(f"✓ Generated tailored content:")
+        print(f"  - Summary: {len(tailored_content['summary'])} characters")
+        print(f"  - Experience items: {len(tailored_content['experience_items'])}")
+        print(f"  - Skills: {len(tailored_content['skills'].split(','))} skills")
+        
+        return tailored_content
+        
+    except Exception as e:
+        raise ResumeForgeError(f"Error classifying role and generating content: {str(e)}")
+
+
+async def classify_then_generate(jd_text: str, roles_to_bullets: Dict[str, ContentStore],
+                                 client: AsyncOpenAI) -> Dict:
+    """
+    Two-stage alternative to classify_and_generate (ROLE_CLASSIFIER=logit_bias).
+    
+    A one-token classification picks the role first, so the synthesizer only
+    receives that role's experience instead of every role's.
+    
+    Args:
+        jd_text: The job description text
+        roles_to_bullets: Mapping of role folder name to its extracted experience items
+        client: AsyncOpenAI client instance
+        
+    Returns:
+        Dictionary with 'role', 'summary', 'experience_items', and 'skills'
+    """
+    # Keyed like classify_and_generate, so a hit skips the classification call too
+    experience = serialize_roles(roles_to_bullets)
+    cached_content = load_cached_content(jd_text, experience)
+    if cached_content is not None:
+        print(f"✓ Selected role category: {cached_content['role']}")
+        return cached_content
+    
+    golden_content = await tailor_from_golden(jd_text, roles_to_bullets, client)
+    if golden_content is not None:
+        save_cached_content(jd_text, experience, golden_content)
+        return golden_content
+    
+    role = await select_role_folder(jd_text, list(roles_to_bullets), client)
+    available_experience = "\n\n".join(select_relevant_bullets(jd_text, roles_to_bullets[role]))
+    
+    tailored_content = await generate_tailored_content(jd_text, available_experience, client)
+    tailored_content["role"] = role
+    save_cached_content(jd_text, experience, tailored_content)
+    save_golden_content(jd_text, tailored_content, roles_to_bullets)
+    
+    return tailored_content
+
+
 # ============================================================================
 # MODULE D: The PDF Compiler
 # ============================================================================
 
+def find_latex_engine() -> str:
+    """
+    Pick the LaTeX engine to compile with.
+    
+    Uses PDFLATEX_ENGINE (default: tectonic) when it is installed and falls
+    back to pdflatex otherwise.
+    
+    Returns:
+        Either "tectonic" or "pdflatex"
+    """
+    if PDFLATEX_ENGINE == "tectonic" and shutil.which("tectonic"):
+        return "tectonic"
+    if shutil.which("pdflatex"):
+        return "pdflatex"
+    
+    raise ResumeForgeError(
+        "No LaTeX engine found. Please install Tectonic or LaTeX:\n"
+        "  Tectonic: https://tectonic-typesetting.github.io/en-US/install.html\n"
+        "  Ubuntu/Debian: sudo apt-get install texlive-latex-base texlive-latex-extra\n"
+        "  macOS: brew install --cask mactex\n"
+        "  Windows: Download from https://miktex.org/"
+    )
+
+
+def prepare_pdflatex_format(rendered_tex: str) -> Optional[Path]:
+    """
+    Precompile the document preamble into a pdflatex format with mylatexformat.
+    
+    Loading the format skips re-reading the document class, packages and fonts
+    on every compile. Formats are cached in FORMAT_DIR, keyed by the preamble.
+    
+    Args:
+        rendered_tex: The rendered LaTeX source
+        
+    Returns:
+        Path to the .fmt file, or None if it could not be built
+    """
+    preamble = rendered_tex.split("\\begin{document}", 1)[0]
+    fmt_name = "master-" + hashlib.sha256(preamble.encode('utf-8')).hexdigest()[:16]
+    fmt_dir = FORMAT_DIR.resolve()
+    fmt_file = fmt_dir / f"{fmt_name}.fmt"
+    
+    with FORMAT_LOCK:
+        if fmt_file.exists():
+            return fmt_file
+        
+        fmt_dir.mkdir(parents=True, exist_ok=True)
+        preamble_file = fmt_dir / f"{fmt_name}.tex"
+        preamble_file.write_text(preamble + "\\begin{document}\n\\end{document}\n", encoding='utf-8')
+        try:
+            result = subprocess.run(
+                ["pdflatex", "-ini", f"-jobname={fmt_name}", f"-output-directory={fmt_dir}",
+                 "&pdflatex", "mylatexformat.ltx", preamble_file.name],
+                cwd=fmt_dir,
+                capture_output=True,
+                timeout=60
+            )
+            built = result.returncode == 0 and fmt_file.exists()
+        except subprocess.TimeoutExpired:
+            built = False
+        
+        if not built:
+            print("⚠ Warning: Could not precompile the LaTeX preamble "
+                  "(is the mylatexformat package installed?), compiling without it")
+            return None
+        
+        print(f"✓ Precompiled LaTeX preamble: {fmt_file}")
+        return fmt_file
+
+
+@functools.lru_cache(maxsize=None)
+def jinja_environment(templates_dir: Path) -> Environment:
+    """
+    Jinja environment for a templates directory.
+    
+    Parsed templates stay cached in memory for the whole run, and their
+    compiled bytecode is cached under .cache/jinja/ across runs (keyed by the
+    template source, so edits are still picked up).
+    """
+    bytecode_dir = cache.CACHE_DIR / "jinja"
+    bytecode_dir.mkdir(parents=True, exist_ok=True)
+    
+    return Environment(
+        loader=FileSystemLoader(str(templates_dir)),
+        autoescape=False,
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=FileSystemBytecodeCache(str(bytecode_dir))
+    )
+
+
+def load_template(template_path: Path) -> Template:
+    """Load a template through its directory's cached Jinja environment."""
+    return jinja_environment(template_path.parent.resolve()).get_template(template_path.name)
+
+
+def prepare_pdf_compile(template_path: Path) -> None:
+    """
+    Do the content-independent part of compiling a resume ahead of time.
+    
+    Renders the template without content to learn its preamble and, for
+    pdflatex, precompiles the preamble format so the final compile only has to
+    typeset the document body. Tectonic manages its own caches, so there is
+    nothing to prepare for it.
+    
+    Args:
+        template_path: Path to the LaTeX template file
+    """
+    if find_latex_engine() != "pdflatex" or not template_path.exists():
+        return
+    
+    template = load_template(template_path)
+    rendered_tex = template.render(summary="", experience_items=[], skills="")
+    prepare_pdflatex_format(rendered_tex)
+
+
+def escape_latex(text: str) -> str:
+    """
+    Escape LaTeX-special characters in generated text.
+    
+    Experience items are plain text since extraction (see latex_to_text). A
+    stray escape such as \\% written by the LLM is undone first so it is not
+    escaped twice.
+    
+    Args:
+        text: Plain text from the tailored content
+        
+    Returns:
+        Text that typesets literally in LaTeX
+    """
+    return LATEX_ESCAPED_RE.sub(r'\1', text).translate(LATEX_ESCAPE)
+
+
 def render_pdf(json_data: Dict, template_path: Path, output_dir: Path) -> Path:
     """
     Render PDF from template and tailored content.
@@ -309,138 +1168,479 @@ def render_pdf(json_data: Dict, template_path: Path, output_dir: Path) -> Path:
     """
     print("\n[MODULE D] Compiling PDF...")
     
-    # Check if pdflatex is available
-    try:
-        subprocess.run(["pdflatex", "--version"], 
-                      capture_output=True, check=True, timeout=5)
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        raise ResumeForgeError(
-            "pdflatex not found. Please install LaTeX:\n"
-            "  Ubuntu/Debian: sudo apt-get install texlive-latex-base texlive-latex-extra\n"
-            "  macOS: brew install --cask mactex\n"
-            "  Windows: Download from https://miktex.org/"
-        )
+    engine = find_latex_engine()
     
     # Load template
     if not template_path.exists():
         raise ResumeForgeError(f"Template not found: {template_path}")
     
-    template_content = template_path.read_text(encoding='utf-8')
-    template = Template(template_content)
+    template = load_template(template_path)
     
     # Render template with data
     rendered_tex = template.render(
-        summary=json_data['summary'],
-        experience_items=json_data['experience_items'],
-        skills=json_data['skills']
+        summary=escape_latex(json_data['summary']),
+        experience_items=[escape_latex(item) for item in json_data['experience_items']],
+        skills=escape_latex(json_data['skills'])
     )
     
-    # Write temporary .tex file
+    # Keep a copy of the .tex file next to the PDF for inspection
     output_dir.mkdir(parents=True, exist_ok=True)
-    temp_tex_file = output_dir / "tailored_resume.tex"
-    temp_tex_file.write_text(rendered_tex, encoding='utf-8')
-    
-    print(f"✓ Generated LaTeX file: {temp_tex_file}")
-    
-    # Compile with pdflatex
-    print("  Compiling with pdflatex...")
-    try:
-        # Run pdflatex twice for proper formatting
-        for i in range(2):
-            result = subprocess.run(
-                ["pdflatex", "-interaction=nonstopmode", temp_tex_file.name],
-                cwd=output_dir,
-                capture_output=True,
-                timeout=30
-            )
-            
-            if result.returncode != 0:
-                error_log = output_dir / "tailored_resume.log"
-                if error_log.exists():
-                    log_content = error_log.read_text()
-                    # Extract relevant error lines
-                    errors = re.findall(r'! .*', log_content)
-                    error_msg = "\n".join(errors[:5]) if errors else "Unknown LaTeX error"
-                else:
-                    error_msg = result.stderr.decode('utf-8', errors='ignore')
-                
-                raise ResumeForgeError(f"pdflatex compilation failed:\n{error_msg}")
+    tex_file = output_dir / "tailored_resume.tex"
+    tex_file.write_text(rendered_tex, encoding='utf-8')
     
-    except subprocess.TimeoutExpired:
-        raise ResumeForgeError("pdflatex compilation timed out")
+    print(f"✓ Generated LaTeX file: {tex_file}")
     
-    # Check if PDF was created
-    pdf_file = output_dir / "tailored_resume.pdf"
-    if not pdf_file.exists():
-        raise ResumeForgeError("PDF file was not generated")
+    print(f"  Compiling with {engine}...")
+    if engine == "tectonic":
+        # Tectonic reruns the engine itself when cross-references need it.
+        # The generous timeout covers downloading the package bundle on first use.
+        commands = [["tectonic", "-X", "compile", tex_file.name]]
+        timeout = 300
+    else:
+        fmt_file = prepare_pdflatex_format(rendered_tex)
+        fmt_args = [f"-fmt={fmt_file}"] if fmt_file else []
+        
+        # A single pass suffices unless the document has cross-references;
+        # those need an extra -draftmode pass (no PDF output) to write the
+        # .aux file first.
+        if CROSS_REFERENCE_RE.search(rendered_tex):
+            passes = [["-draftmode"], []]
+        else:
+            passes = [[]]
+        
+        commands = [
+            ["pdflatex", *fmt_args, *extra_args, "-interaction=nonstopmode", "-halt-on-error",
+             tex_file.name]
+            for extra_args in passes
+        ]
+        timeout = 30
     
-    # Clean up auxiliary files
-    for ext in ['.aux', '.log', '.out']:
-        aux_file = output_dir / f"tailored_resume{ext}"
-        if aux_file.exists():
-            aux_file.unlink()
+    # Compile in a scratch directory (on tmpfs where available) so the
+    # .aux, .log and .out files never touch the disk; only the PDF is kept
+    with tempfile.TemporaryDirectory(prefix="resumeforge-", dir=COMPILE_TMP_DIR) as compile_dir:
+        compile_dir = Path(compile_dir)
+        (compile_dir / tex_file.name).write_text(rendered_tex, encoding='utf-8')
+        
+        try:
+            for command in commands:
+                result = subprocess.run(
+                    command,
+                    cwd=compile_dir,
+                    capture_output=True,
+                    timeout=timeout
+                )
+                
+                if result.returncode != 0:
+                    error_log = compile_dir / "tailored_resume.log"
+                    if error_log.exists():
+                        log_content = error_log.read_text()
+                        # Extract relevant error lines
+                        errors = re.findall(r'! .*', log_content)
+                        error_msg = "\n".join(errors[:5]) if errors else "Unknown LaTeX error"
+                    else:
+                        error_msg = result.stderr.decode('utf-8', errors='ignore')
+                    
+                    raise ResumeForgeError(f"{engine} compilation failed:\n{error_msg}")
+        
+        except subprocess.TimeoutExpired:
+            raise ResumeForgeError(f"{engine} compilation timed out")
+        
+        # Check if PDF was created
+        compiled_pdf = compile_dir / "tailored_resume.pdf"
+        if not compiled_pdf.exists():
+            raise ResumeForgeError("PDF file was not generated")
+        
+        pdf_file = output_dir / "tailored_resume.pdf"
+        shutil.move(compiled_pdf, pdf_file)
     
     print(f"✓ PDF compiled successfully: {pdf_file}")
     
     return pdf_file
 
 
+async def render_pdf_async(json_data: Dict, template_path: Path, output_dir: Path) -> Path:
+    """
+    Run render_pdf on the PDF worker pool.
+    
+    Each compile is a separate LaTeX process, so up to PDF_WORKERS resumes
+    compile in parallel across cores while the event loop keeps serving
+    API calls.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(PDF_EXECUTOR, render_pdf, json_data, template_path, output_dir)
+
+
 # ============================================================================
-# MAIN PIPELINE
+# MULTI-JD MODE: Concurrent Realtime API & OpenAI Batch API
 # ============================================================================
 
-def main():
-    """Main pipeline orchestration."""
-    print("=" * 70)
-    print("ResumeForge - Automated Resume Tailoring Pipeline")
-    print("=" * 70)
+def load_job_descriptions(jd_dir: Path) -> Dict[str, str]:
+    """
+    Load every job description in a directory.
     
-    try:
-        # Initialize OpenAI client
-        client = setup_openai_client()
-        print("✓ OpenAI client initialized")
+    Args:
+        jd_dir: Directory containing one .txt file per job description
         
-        # Read job description
-        if not JOB_DESCRIPTION_FILE.exists():
-            raise ResumeForgeError(
-                f"Job description file not found: {JOB_DESCRIPTION_FILE}\n"
-                f"Please create this file with the job description text."
-            )
+    Returns:
+        Mapping of job description name (file stem) to its text
+    """
+    if not jd_dir.exists():
+        raise ResumeForgeError(
+            f"Job descriptions directory not found: {jd_dir}\n"
+            f"Please create it and add one .txt file per job description."
+        )
+    
+    jds = {
+        jd_file.stem: jd_file.read_text(encoding='utf-8')
+        for jd_file in sorted(jd_dir.glob("*.txt"))
+    }
+    
+    if not jds:
+        raise ResumeForgeError(f"No job description .txt files found in {jd_dir}")
+    
+    return jds
+
+
+def collect_generated_resumes(jds: Dict[str, str], jd_names: List[str], results: List) -> Dict[str, Path]:
+    """
+    Gather per-job-description results from asyncio.gather(..., return_exceptions=True).
+    
+    Pipeline errors skip the job description with a warning; unexpected errors
+    are re-raised. Fails if no resume was generated at all.
+    
+    Returns:
+        Mapping of job description name to its generated PDF
+    """
+    pdfs = {}
+    for jd_name, result in zip(jd_names, results):
+        if isinstance(result, ResumeForgeError):
+            print(f"⚠ Warning: Skipping '{jd_name}': {str(result)}", file=sys.stderr)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            pdfs[jd_name] = result
+    
+    missing = sorted(set(jds) - set(pdfs))
+    if missing:
+        print(f"⚠ Warning: No resume generated for: {', '.join(missing)}", file=sys.stderr)
+    if not pdfs:
+        raise ResumeForgeError("No resumes were generated")
+    
+    return pdfs
+
+
+async def run_concurrent(jds: Dict[str, str], roles_to_bullets: Dict[str, ContentStore],
+                         client: AsyncOpenAI, output_dir: Path) -> Dict[str, Path]:
+    """
+    Tailor and compile a resume for every job description via concurrent realtime calls.
+    
+    At most OPENAI_CONCURRENCY API requests are in flight at once.
+    
+    Args:
+        jds: Mapping of job description name to its text
+        roles_to_bullets: Mapping of role folder name to its extracted experience items
+        client: AsyncOpenAI client instance
+        output_dir: Directory under which one sub-folder per job description is created
         
-        jd_text = JOB_DESCRIPTION_FILE.read_text(encoding='utf-8')
-        print(f"✓ Loaded job description ({len(jd_text)} characters)")
+    Returns:
+        Mapping of job description name to its generated PDF
+    """
+    print(f"\n[CONCURRENT] Tailoring {len(jds)} job description(s), "
+          f"up to {OPENAI_CONCURRENCY} request(s) at a time...")
+    
+    sem = asyncio.Semaphore(OPENAI_CONCURRENCY)
+    
+    results = await asyncio.gather(
+        *[tailor_and_render(jd_text, roles_to_bullets, client, output_dir / jd_name, sem)
+          for jd_name, jd_text in jds.items()],
+        return_exceptions=True
+    )
+    
+    return collect_generated_resumes(jds, list(jds), results)
+
+
+async def submit_batch(jds: Dict[str, str], roles_to_bullets: Dict[str, ContentStore], client: AsyncOpenAI) -> str:
+    """
+    Upload one combined classify + generate request per job description as a batch.
+    
+    Args:
+        jds: Mapping of job description name to its text
+        roles_to_bullets: Mapping of role folder name to its extracted experience items
+        client: AsyncOpenAI client instance
+        
+    Returns:
+        The ID of the created batch
+    """
+    lines = [
+        json.dumps({
+            "custom_id": jd_name,
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": build_tailoring_request(jd_text, roles_to_bullets),
+        })
+        for jd_name, jd_text in jds.items()
+    ]
+    
+    batch_file = await client.files.create(
+        file=("batch_requests.jsonl", "\n".join(lines).encode('utf-8')),
+        purpose="batch"
+    )
+    batch = await client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window="24h"
+    )
+    
+    print(f"✓ Submitted batch {batch.id} with {len(lines)} request(s)")
+    return batch.id
+
+
+async def wait_for_batch(batch_id: str, client: AsyncOpenAI,
+                         initial_delay: float = 5.0, max_delay: float = 300.0):
+    """
+    Poll a batch with exponential backoff until it completes.
+    
+    Args:
+        batch_id: The ID of the batch to wait for
+        client: AsyncOpenAI client instance
+        initial_delay: Seconds to wait before the second poll
+        max_delay: Upper bound on the wait between polls
         
-        # Get list of role folders
-        if not LIBRARY_DIR.exists():
-            raise ResumeForgeError(f"Library directory not found: {LIBRARY_DIR}")
+    Returns:
+        The completed batch object
+    """
+    delay = initial_delay
+    
+    while True:
+        batch = await client.batches.retrieve(batch_id)
         
-        role_folders = [f.name for f in LIBRARY_DIR.iterdir() if f.is_dir()]
+        if batch.status == "completed":
+            return batch
+        if batch.status in ("failed", "expired", "cancelling", "cancelled"):
+            raise ResumeForgeError(f"Batch {batch_id} ended with status '{batch.status}'")
         
-        if not role_folders:
-            raise ResumeForgeError(f"No role folders found in {LIBRARY_DIR}")
+        print(f"  Batch status: {batch.status} (checking again in {delay:.0f}s)")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, max_delay)
+
+
+async def run_batch(jds: Dict[str, str], roles_to_bullets: Dict[str, ContentStore],
+                    client: AsyncOpenAI, output_dir: Path) -> Dict[str, Path]:
+    """
+    Tailor and compile a resume for every job description via the Batch API.
+    
+    Args:
+        jds: Mapping of job description name to its text
+        roles_to_bullets: Mapping of role folder name to its extracted experience items
+        client: AsyncOpenAI client instance
+        output_dir: Directory under which one sub-folder per job description is created
+        
+    Returns:
+        Mapping of job description name to its generated PDF
+    """
+    experience = serialize_roles(roles_to_bullets)
+    
+    tailored = {}
+    pending = {}
+    for jd_name, jd_text in jds.items():
+        cached_content = load_cached_content(jd_text, experience)
+        if cached_content is not None:
+            tailored[jd_name] = cached_content
+        else:
+            pending[jd_name] = jd_text
+    
+    if tailored:
+        print(f"\n✓ Cache hit for {len(tailored)} job description(s), skipping them in the batch")
+    
+    if pending:
+        print(f"\n[BATCH] Submitting {len(pending)} job description(s) to the OpenAI Batch API...")
         
-        print(f"✓ Found {len(role_folders)} role categories: {', '.join(role_folders)}")
+        batch_id = await submit_batch(pending, roles_to_bullets, client)
+        batch = await wait_for_batch(batch_id, client)
         
-        # MODULE A: Classify role
-        selected_role = select_role_folder(jd_text, role_folders, client)
+        # Failed requests are reported in a separate error file, in the same record format
+        output = ""
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                output += (await client.files.content(file_id)).text + "\n"
         
-        # MODULE B: Parse LaTeX files
-        role_folder_path = LIBRARY_DIR / selected_role
-        available_experience = parse_tex_files(role_folder_path)
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            
+            try:
+                record = json.loads(line)
+                jd_name = record["custom_id"]
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                print(f"⚠ Warning: Skipping malformed batch record ({type(e).__name__}: {e})", file=sys.stderr)
+                continue
+            
+            try:
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    raise ResumeForgeError(f"request failed: {record.get('error') or response.get('body')}")
+                
+                content = response["body"]["choices"][0]["message"]["content"]
+                tailored[jd_name] = parse_tailoring_response(content, list(roles_to_bullets))
+                save_cached_content(pending[jd_name], experience, tailored[jd_name])
+                save_golden_content(pending[jd_name], tailored[jd_name], roles_to_bullets)
+            except ResumeForgeError as e:
+                print(f"⚠ Warning: Skipping '{jd_name}': {str(e)}", file=sys.stderr)
+            except (KeyError, IndexError, TypeError, AttributeError) as e:
+                print(f"⚠ Warning: Skipping '{jd_name}': unexpected response body ({type(e).__name__}: {e})",
+                      file=sys.stderr)
         
-        # MODULE C: Generate tailored content
-        tailored_content = generate_tailored_content(jd_text, available_experience, client)
+        if not batch.output_file_id:
+            if not tailored:
+                raise ResumeForgeError(f"Batch {batch_id} completed without any successful responses")
+            print(f"⚠ Warning: Batch {batch_id} completed without any successful responses; "
+                  f"compiling the {len(tailored)} cached job description(s) only", file=sys.stderr)
+    
+    # MODULE D: Compile all PDFs in parallel on the worker pool
+    for jd_name, tailored_content in tailored.items():
+        print(f"\n✓ [{jd_name}] Selected role category: {tailored_content['role']}")
+    
+    results = await asyncio.gather(
+        *[render_pdf_async(tailored_content, MASTER_TEMPLATE, output_dir / jd_name)
+          for jd_name, tailored_content in tailored.items()],
+        return_exceptions=True
+    )
+    
+    return collect_generated_resumes(jds, list(tailored), results)
+
+
+# ============================================================================
+# MAIN PIPELINE
+# ============================================================================
+
+async def tailor_and_render(jd_text: str, roles_to_bullets: Dict[str, ContentStore], client: AsyncOpenAI,
+                            output_dir: Path, sem: Optional[asyncio.Semaphore] = None) -> Path:
+    """
+    Run Modules A+C and D for one job description.
+    
+    LaTeX preparation starts on the PDF worker pool before the API request
+    is sent, overlapping it with the wait for the response.
+    
+    Args:
+        jd_text: The job description text
+        roles_to_bullets: Mapping of role folder name to its extracted experience items
+        client: AsyncOpenAI client instance
+        output_dir: Directory to save output files
+        sem: Optional semaphore bounding concurrent API requests
         
-        # MODULE D: Compile PDF
-        pdf_path = render_pdf(tailored_content, MASTER_TEMPLATE, OUTPUT_DIR)
+    Returns:
+        Path to the generated PDF file
+    """
+    loop = asyncio.get_running_loop()
+    preparation = loop.run_in_executor(PDF_EXECUTOR, prepare_pdf_compile, MASTER_TEMPLATE)
+    
+    try:
+        async with (sem or asyncio.Semaphore(1)):
+            if ROLE_CLASSIFIER == "logit_bias":
+                tailored_content = await classify_then_generate(jd_text, roles_to_bullets, client)
+            else:
+                tailored_content = await classify_and_generate(jd_text, roles_to_bullets, client)
+    finally:
+        # Preparation is best-effort; render_pdf reports any real problem itself
+        await asyncio.gather(preparation, return_exceptions=True)
+    
+    return await render_pdf_async(tailored_content, MASTER_TEMPLATE, output_dir)
+
+
+async def run_pipeline(args: argparse.Namespace) -> int:
+    """Run the pipeline for the job description(s) selected on the command line."""
+    global BM25_BACKEND
+    
+    # Initialize OpenAI client
+    client = setup_openai_client()
+    print("✓ OpenAI client initialized")
+    
+    # Read job description(s)
+    if args.batch or args.all:
+        jds = load_job_descriptions(JOB_DESCRIPTIONS_DIR)
+        print(f"✓ Loaded {len(jds)} job description(s) from {JOB_DESCRIPTIONS_DIR}")
+    else:
+        if not JOB_DESCRIPTION_FILE.exists():
+            raise ResumeForgeError(
+                f"Job description file not found: {JOB_DESCRIPTION_FILE}\n"
+                f"Please create this file with the job description text."
+            )
         
-        # Success!
-        print("\n" + "=" * 70)
-        print("✓ SUCCESS! Resume tailored and compiled.")
-        print(f"✓ Output PDF: {pdf_path.absolute()}")
-        print("=" * 70)
+        jd_text = JOB_DESCRIPTION_FILE.read_text(encoding='utf-8')
+        print(f"✓ Loaded job description ({len(jd_text)} characters)")
+    
+    # Get list of role folders
+    if not LIBRARY_DIR.exists():
+        raise ResumeForgeError(f"Library directory not found: {LIBRARY_DIR}")
+    
+    role_folders = [f.name for f in LIBRARY_DIR.iterdir() if f.is_dir()]
+    
+    if not role_folders:
+        raise ResumeForgeError(f"No role folders found in {LIBRARY_DIR}")
+    
+    print(f"✓ Found {len(role_folders)} role categories: {', '.join(role_folders)}")
+    
+    # MODULE B: Parse LaTeX files for every role up-front (cheap local reads)
+    roles_to_bullets = {
+        role: parse_tex_files(LIBRARY_DIR / role) for role in role_folders
+    }
+    
+    # Numba's JIT compile only pays off when enough rankings share the process
+    if (args.batch or args.all) and len(jds) * len(roles_to_bullets) >= NUMBA_MIN_QUERIES:
+        BM25_BACKEND = "numba"
+    
+    async with client:
+        if args.batch or args.all:
+            # MODULE A+C via the Batch API or concurrent realtime calls,
+            # then MODULE D per job description
+            if args.batch:
+                pdfs = await run_batch(jds, roles_to_bullets, client, OUTPUT_DIR)
+            else:
+                pdfs = await run_concurrent(jds, roles_to_bullets, client, OUTPUT_DIR)
+            
+            print("\n" + "=" * 70)
+            print(f"✓ SUCCESS! {len(pdfs)} resume(s) tailored and compiled.")
+            for jd_name, pdf_path in pdfs.items():
+                print(f"✓ {jd_name}: {pdf_path.absolute()}")
+            print("=" * 70)
+            
+            return 0
         
-        return 0
+        # MODULE A+C: Classify role and generate tailored content in one call,
+        # then MODULE D: Compile PDF
+        pdf_path = await tailor_and_render(jd_text, roles_to_bullets, client, OUTPUT_DIR)
+    
+    # Success!
+    print("\n" + "=" * 70)
+    print("✓ SUCCESS! Resume tailored and compiled.")
+    print(f"✓ Output PDF: {pdf_path.absolute()}")
+    print("=" * 70)
+    
+    return 0
+
+
+def main():
+    """Main pipeline orchestration."""
+    parser = argparse.ArgumentParser(description="ResumeForge - Automated Resume Tailoring Pipeline")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--all", action="store_true",
+        help=f"Tailor every .txt job description in {JOB_DESCRIPTIONS_DIR} with concurrent "
+             "realtime API calls (see OPENAI_CONCURRENCY)"
+    )
+    mode.add_argument(
+        "--batch", action="store_true",
+        help=f"Tailor every .txt job description in {JOB_DESCRIPTIONS_DIR} via the OpenAI Batch API "
+             "(about half the cost, results within 24h)"
+    )
+    args = parser.parse_args()
+    
+    print("=" * 70)
+    print("ResumeForge - Automated Resume Tailoring Pipeline")
+    print("=" * 70)
+    
+    try:
+        return asyncio.run(run_pipeline(args))
         
     except ResumeForgeError as e:
         print(f"\n❌ ERROR: {str(e)}", file=sys.stderr)